@@ -34,7 +34,7 @@ from .deadline import Deadline
 from .deprecated import MetricsProvider
 from .priority import Priority
 from .transport import Transport
-from .utils import try_parse_float
+from .utils import get_labelled_metric, get_status_label, try_parse_float
 
 try:
     import prometheus_client as prom
@@ -72,19 +72,19 @@ try:
         ),
     )
 
-    def capture_metrics(*, method: str, path: str, client: str, status: int, started_at: float) -> None:
+    def capture_metrics(*, method: str, path: str, client: str, status: int, started_at: int) -> None:
         label_values = (
             client,
             method,
             path,
-            str(status),
+            get_status_label(status),
         )
-        elapsed = max(0.0, time.perf_counter() - started_at)
-        latency_histogram.labels(*label_values).observe(elapsed)
+        elapsed_ns = time.perf_counter_ns() - started_at
+        get_labelled_metric(latency_histogram, label_values).observe(elapsed_ns / 1e9)
 
 except ImportError:
 
-    def capture_metrics(*, method: str, path: str, client: str, status: int, started_at: float) -> None:
+    def capture_metrics(*, method: str, path: str, client: str, status: int, started_at: int) -> None:
         pass
 
 
@@ -161,7 +161,8 @@ class AioHttpDnsResolver(aiohttp.abc.AbstractResolver):
 class AioHttpTransport(Transport):
     __slots__ = (
         "__client_session",
-        "__network_errors_code",
+        "__network_error_response",
+        "__timeout_response",
         "__too_many_redirects_code",
         "__buffer_payload",
     )
@@ -182,7 +183,9 @@ class AioHttpTransport(Transport):
             )
 
         self.__client_session = client_session
-        self.__network_errors_code = network_errors_code
+        # Responses without headers cannot change, so they are created once per transport
+        self.__network_error_response = EmptyResponse(status=network_errors_code)
+        self.__timeout_response = EmptyResponse(status=408)
         self.__buffer_payload = buffer_payload
         self.__too_many_redirects_code = too_many_redirects_code
 
@@ -254,7 +257,7 @@ class AioHttpTransport(Transport):
                     "request_url": url,
                 },
             )
-            return EmptyResponse(status=self.__network_errors_code)
+            return self.__network_error_response
         except asyncio.TimeoutError:
             logger.warning(
                 "Request %s %s has timed out after %s",
@@ -267,7 +270,7 @@ class AioHttpTransport(Transport):
                     "request_timeout": timeout,
                 },
             )
-            return EmptyResponse(status=408)
+            return self.__timeout_response
 
 
 class _AioHttpResponse(ClosableResponse):
@@ -295,7 +298,7 @@ class _AioHttpResponse(ClosableResponse):
         content_type: str | None = "application/json",
     ) -> Any:
         if content_type is not None:
-            response_content_type = self.__response.headers.get(Header.CONTENT_TYPE, "").lower()
+            response_content_type = self.__response.headers.get(Header.CONTENT_TYPE, "")
             if not is_expected_content_type(response_content_type, content_type):
                 raise UnexpectedContentTypeError(f"Expected {content_type}, actual {response_content_type}")
 
@@ -331,12 +334,14 @@ def aiohttp_middleware_factory(
             DeprecationWarning,
         )
 
+    client_header_name = multidict.istr(client_header_name)
+
     @aiohttp.web_middlewares.middleware
     async def middleware(
         request: aiohttp.web_request.Request, handler: aiohttp.typedefs.Handler
     ) -> aiohttp.web_response.StreamResponse:
         deadline = _get_deadline(request) or _get_deadline_from_handler(request) or Deadline.from_timeout(timeout)
-        started_at = time.perf_counter()
+        started_at = time.perf_counter_ns()
         try:
             response: aiohttp.web_response.StreamResponse | None
             if deadline.expired or deadline.timeout <= low_timeout_threshold:
@@ -1,8 +1,10 @@
 import abc
 import collections.abc
+import functools
 import json
 import re
-from typing import Any
+import string
+from typing import Any, cast
 
 import multidict
 import yarl
@@ -36,17 +38,31 @@ _MultiDict = (
     collections.abc.Mapping[str | multidict.istr, str] | multidict.CIMultiDictProxy[str] | multidict.CIMultiDict[str]
 )
 
-json_re = re.compile(r"^application/(?:[\w.+-]+?\+)?json", re.RegexFlag.IGNORECASE)
+JSON_MIME_TYPES = frozenset(("application/json",))
+JSON_MIME_SUBTYPE_PREFIX_CHARS = frozenset(string.ascii_lowercase + string.digits + "_.+-")
+PATH_PARAMETER_RE = re.compile(r"%7B([^%]+)%7D")
 
 PathParameters = collections.abc.Mapping[str, Any]
 QueryParameters = collections.abc.Mapping[str, Any] | collections.abc.Iterable[tuple[str, Any]] | _MultiDict
 Headers = _MultiDict
+HeaderItems = collections.abc.Iterable[tuple[str | multidict.istr, str]]
+
+
+@functools.lru_cache(maxsize=256)
+def _is_json_content_type(content_type: str) -> bool:
+    mime_type = content_type.split(";", 1)[0].strip().lower()
+    if mime_type in JSON_MIME_TYPES:
+        return True
+    if not mime_type.startswith("application/") or not mime_type.endswith("+json"):
+        return False
+    subtype_prefix = mime_type[len("application/") : -len("+json")]
+    return bool(subtype_prefix) and JSON_MIME_SUBTYPE_PREFIX_CHARS.issuperset(subtype_prefix)
 
 
 def is_expected_content_type(response_content_type: str, expected_content_type: str) -> bool:
     if expected_content_type == "application/json":
-        return bool(json_re.match(response_content_type))
-    return expected_content_type in response_content_type
+        return _is_json_content_type(response_content_type)
+    return expected_content_type in response_content_type.lower()
 
 
 class UnexpectedContentTypeError(Exception):
@@ -64,6 +80,7 @@ class Request:
         "allow_redirects",
         "max_redirects",
     )
+    __match_args__ = ("method", "url")
 
     def __init__(
         self,
@@ -89,37 +106,38 @@ class Request:
         self.allow_redirects = allow_redirects
         self.max_redirects = max_redirects
 
-    def update_headers(self, headers: Headers) -> "Request":
-        updated_headers = (
-            multidict.CIMultiDict[str](self.headers) if self.headers is not None else multidict.CIMultiDict[str]()
-        )
+    def update_headers(self, headers: Headers | HeaderItems) -> "Request":
+        if not headers:
+            return self
+        if self.headers is None:
+            return self._with_headers(multidict.CIMultiDict[str](headers))
+
+        updated_headers = multidict.CIMultiDict[str](self.headers)
         updated_headers.update(headers)
-        return Request(
-            method=self.method,
-            url=self.url,
-            path_parameters=self.path_parameters,
-            query_parameters=self.query_parameters,
-            headers=updated_headers,
-            body=self.body,
-            allow_redirects=self.allow_redirects,
-            max_redirects=self.max_redirects,
-        )
-
-    def extend_headers(self, headers: Headers) -> "Request":
-        updated_headers = (
-            multidict.CIMultiDict[str](self.headers) if self.headers is not None else multidict.CIMultiDict[str]()
-        )
+        return self._with_headers(updated_headers)
+
+    def extend_headers(self, headers: Headers | HeaderItems) -> "Request":
+        if not headers:
+            return self
+        if self.headers is None:
+            return self._with_headers(multidict.CIMultiDict[str](headers))
+
+        updated_headers = multidict.CIMultiDict[str](self.headers)
         updated_headers.extend(headers)
-        return Request(
-            method=self.method,
-            url=self.url,
-            path_parameters=self.path_parameters,
-            query_parameters=self.query_parameters,
-            headers=updated_headers,
-            body=self.body,
-            allow_redirects=self.allow_redirects,
-            max_redirects=self.max_redirects,
-        )
+        return self._with_headers(updated_headers)
+
+    def _with_headers(self, headers: Headers) -> "Request":
+        # The url has already been validated by __init__, so the copy bypasses it
+        request = Request.__new__(Request)
+        request.method = self.method
+        request.url = self.url
+        request.path_parameters = self.path_parameters
+        request.query_parameters = self.query_parameters
+        request.headers = headers
+        request.body = self.body
+        request.allow_redirects = self.allow_redirects
+        request.max_redirects = self.max_redirects
+        return request
 
     def __repr__(self) -> str:
         return f"<Request [{self.method} {self.url}]>"
@@ -172,7 +190,11 @@ class Response(abc.ABC):
 
     @property
     def is_json(self) -> bool:
-        return bool(json_re.match(self.content_type or ""))
+        return is_expected_content_type(self.content_type or "", "application/json")
+
+    @property
+    def circuit_breaker(self) -> bool:
+        return Header.X_CIRCUIT_BREAKER in self.headers
 
     def __repr__(self) -> str:
         return f"<Response [{self.status}]>"
@@ -186,11 +208,12 @@ class ClosableResponse(Response, Closable):
 
 
 class EmptyResponse(ClosableResponse):
-    __slots__ = ("__status", "__headers")
+    __slots__ = ("__status", "__headers", "__content_type")
 
     def __init__(self, *, status: int, headers: multidict.CIMultiDictProxy[str] = EMPTY_HEADERS):
         self.__status = status
         self.__headers = headers
+        self.__content_type = headers.get(Header.CONTENT_TYPE)
 
     @property
     def status(self) -> int:
@@ -200,6 +223,10 @@ class EmptyResponse(ClosableResponse):
     def headers(self) -> multidict.CIMultiDictProxy[str]:
         return self.__headers
 
+    @property
+    def content_type(self) -> str | None:
+        return self.__content_type
+
     async def json(
         self,
         *,
@@ -208,14 +235,14 @@ class EmptyResponse(ClosableResponse):
         content_type: str | None = "application/json",
     ) -> Any:
         if content_type is not None:
-            response_content_type = self.__headers.get(Header.CONTENT_TYPE, "").lower()
+            response_content_type = self.__content_type or ""
             if not is_expected_content_type(response_content_type, content_type):
                 raise UnexpectedContentTypeError(f"Expected {content_type}, actual {response_content_type}")
 
         return None
 
     async def read(self) -> bytes:
-        return bytes()
+        return b""
 
     async def text(self, encoding: str | None = None) -> str:
         return ""
@@ -231,28 +258,30 @@ def build_query_parameters(query_parameters: QueryParameters) -> dict[str, str |
     ):
         if value is None:
             continue
-        if not isinstance(value, str) and isinstance(value, collections.abc.Iterable):
+        # Names are always strings, the tuple in their inferred type comes from the overlapping iterable aliases
+        name = cast(str, name)
+        # Common scalars are checked first to avoid the slow ABC isinstance check
+        if isinstance(value, (str, int, float)) or not isinstance(value, collections.abc.Iterable):
+            value = str(value)
+            existing_value = parameters.get(name)
+            if existing_value is None:
+                parameters[name] = value
+            elif isinstance(existing_value, str):
+                parameters[name] = [existing_value, value]
+            else:
+                existing_value.append(value)
+        else:
             values = [str(v) for v in value if v is not None]
             if not values:
                 continue
-
-            if name in parameters:
-                existing_value = parameters[name]
-                if isinstance(existing_value, str):
-                    parameters[name] = [existing_value, *values]
-                else:
-                    parameters[name] = [*existing_value, *values]
-            else:
-                parameters[name] = values  # type: ignore
-        else:
-            if name in parameters:
-                existing_value = parameters[name]
-                if isinstance(existing_value, str):
-                    parameters[name] = [existing_value, str(value)]
-                else:
-                    parameters[name] = [*existing_value, str(value)]
+            existing_value = parameters.get(name)
+            if existing_value is None:
+                parameters[name] = values
+            elif isinstance(existing_value, str):
+                values.insert(0, existing_value)
+                parameters[name] = values
             else:
-                parameters[name] = str(value)  # type: ignore
+                existing_value.extend(values)
     return parameters
 
 
@@ -260,19 +289,33 @@ def substitute_path_parameters(url: yarl.URL, parameters: PathParameters | None
     if not parameters:
         return url
 
-    path = url.raw_path
-    for name, value in parameters.items():
-        path = path.replace(f"%7B{name}%7D", str(value))
+    if "%7B" not in url.raw_path:
+        return url
+
+    # Values are substituted by their str form, so it is enough to key the cache on it
+    return _substitute_path_parameters(url, tuple([(name, str(value)) for name, value in parameters.items()]))
+
 
-    build_parameters: dict[str, Any] = dict(
+@functools.lru_cache(maxsize=1024)
+def _substitute_path_parameters(url: yarl.URL, parameters: tuple[tuple[str, str], ...]) -> yarl.URL:
+    values = dict(parameters)
+
+    def _substitute(match: re.Match[str]) -> str:
+        return values.get(match.group(1), match.group(0))
+
+    raw_path = url.raw_path
+    path = PATH_PARAMETER_RE.sub(_substitute, raw_path)
+    if path == raw_path:
+        return url
+
+    return yarl.URL.build(
         scheme=url.scheme,
         user=url.raw_user,
         password=url.raw_password,
-        host=url.raw_host,
+        host=url.raw_host or "",
         port=url.port,
         path=path,
         query_string=url.raw_query_string,
         fragment=url.raw_fragment,
+        encoded=True,
     )
-
-    return yarl.URL.build(**{k: v for k, v in build_parameters.items() if v is not None}, encoded=True)
@@ -3,8 +3,9 @@ import collections
 import collections.abc
 import dataclasses
 import enum
+import fractions
 import time
-from typing import Generic, TypeVar
+from typing import Generic, NamedTuple, TypeVar
 
 
 class CircuitState(enum.StrEnum):
@@ -13,9 +14,14 @@ class CircuitState(enum.StrEnum):
     CLOSED = enum.auto()
 
 
-@dataclasses.dataclass(slots=True, kw_only=True)
-class CircuitBreakerMetricsSnapshot:
-    started_at: float
+# Module-level aliases save an attribute lookup on the enum class in the per-call paths
+_CLOSED = CircuitState.CLOSED
+_HALF_OPEN = CircuitState.HALF_OPEN
+_OPEN = CircuitState.OPEN
+
+
+class CircuitBreakerMetricsSnapshot(NamedTuple):
+    started_at: int
     successes: int = 0
     failures: int = 0
 
@@ -37,50 +43,78 @@ class CircuitBreakerMetrics(abc.ABC):
 
 
 class RollingCircuitBreakerMetrics(CircuitBreakerMetrics):
-    __slots__ = ("_window_duration", "_sampling_duration", "_last_n", "_current")
+    __slots__ = (
+        "_window_duration",
+        "_windows_count",
+        "_successes",
+        "_failures",
+        "_total_successes",
+        "_total_failures",
+        "_first_window",
+        "_current_window",
+        "_refreshed_at",
+    )
 
     def __init__(self, sampling_duration: float, windows_count: int) -> None:
-        self._sampling_duration = sampling_duration
-        self._window_duration = sampling_duration / windows_count
-        self._last_n: collections.deque = collections.deque()  # type: ignore
-        self._current: CircuitBreakerMetricsSnapshot | None = None
-
-    def increment_successes(self) -> None:
-        self._refresh()
-        self._current.successes += 1  # type: ignore
-
-    def increment_failures(self) -> None:
-        self._refresh()
-        self._current.failures += 1  # type: ignore
+        # All timestamps and durations are integer nanoseconds of time.monotonic_ns()
+        self._window_duration = max(int(sampling_duration * 1e9) // windows_count, 1)
+        self._windows_count = windows_count
+        # Windows are aligned to multiples of window_duration and their counters are kept
+        # in parallel lists indexed by window id modulo windows_count
+        self._successes = [0] * windows_count
+        self._failures = [0] * windows_count
+        # Sums over all live windows, kept up to date on increments and expiration
+        self._total_successes = 0
+        self._total_failures = 0
+        self._first_window = -1
+        self._current_window = -1
+        self._refreshed_at = -1
+
+    # now is an optional time.monotonic_ns() value, so callers can share a single clock read
+
+    def increment_successes(self, now: int | None = None) -> None:
+        self._successes[self._refresh(time.monotonic_ns() if now is None else now)] += 1
+        self._total_successes += 1
+
+    def increment_failures(self, now: int | None = None) -> None:
+        self._failures[self._refresh(time.monotonic_ns() if now is None else now)] += 1
+        self._total_failures += 1
 
     def reset(self) -> None:
-        self._current = None
-        self._last_n.clear()
-
-    def collect(self) -> CircuitBreakerMetricsSnapshot:
-        self._refresh()
-
-        successes, failures = 0, 0
-        for last in self._last_n:
-            successes += last.successes
-            failures += last.failures
-
+        self._successes = [0] * self._windows_count
+        self._failures = [0] * self._windows_count
+        self._total_successes = 0
+        self._total_failures = 0
+        self._first_window = -1
+        self._current_window = -1
+        self._refreshed_at = -1
+
+    def collect(self, now: int | None = None) -> CircuitBreakerMetricsSnapshot:
+        # Collecting right after an increment at the same moment finds the windows already fresh
+        if now is None or now != self._refreshed_at:
+            self._refresh(time.monotonic_ns() if now is None else now)
+
+        first_window = max(self._current_window - self._windows_count + 1, self._first_window)
         return CircuitBreakerMetricsSnapshot(
-            started_at=self._last_n[0].started_at, successes=successes, failures=failures
+            first_window * self._window_duration, self._total_successes, self._total_failures
         )
 
-    def _refresh(self) -> None:
-        now = time.time()
-        if self._current is None or (now - self._current.started_at) >= self._window_duration:
-            self._current = CircuitBreakerMetricsSnapshot(started_at=now)
-            self._last_n.append(self._current)
-
-        while self._last_n:
-            last_state = self._last_n[0]
-            if (now - last_state.started_at) < self._sampling_duration:
-                break
-
-            self._last_n.popleft()
+    def _refresh(self, now: int) -> int:
+        self._refreshed_at = now
+        windows_count = self._windows_count
+        window = now // self._window_duration
+        if window != self._current_window:
+            if self._current_window < 0:
+                self._first_window = window
+            # Windows skipped since the last refresh have expired together with the reused one
+            for expired_window in range(max(self._current_window + 1, window - windows_count + 1), window + 1):
+                index = expired_window % windows_count
+                self._total_successes -= self._successes[index]
+                self._total_failures -= self._failures[index]
+                self._successes[index] = 0
+                self._failures[index] = 0
+            self._current_window = window
+        return window % windows_count
 
 
 TScope = TypeVar("TScope")
@@ -105,14 +139,25 @@ class CircuitBreaker(Generic[TScope, TResult], abc.ABC):
     def state(self) -> collections.abc.Mapping[TScope, CircuitState]: ...
 
 
+@dataclasses.dataclass(slots=True, kw_only=True)
+class _ScopeEntry:
+    metrics: RollingCircuitBreakerMetrics
+    state: CircuitState = CircuitState.CLOSED
+    blocked_till: int = 0
+    # Bumped on every state transition to detect outcomes of operations started in an earlier state
+    generation: int = 0
+
+
 class DefaultCircuitBreaker(CircuitBreaker[TScope, TResult]):
     __slots__ = (
-        "__break_duration",
+        "__break_duration_ns",
         "__minimum_throughput",
-        "__failure_threshold",
-        "__per_scope_metrics",
-        "__per_scope_state",
-        "__per_scope_blocked_till",
+        "__failure_threshold_numerator",
+        "__failure_threshold_denominator",
+        "__sampling_duration",
+        "__windows_count",
+        "__max_scopes",
+        "__scopes",
     )
 
     def __init__(
@@ -123,12 +168,17 @@ class DefaultCircuitBreaker(CircuitBreaker[TScope, TResult]):
         minimum_throughput: int,
         sampling_duration: float,
         windows_count: int = 10,
+        max_scopes: int = 1024,
     ):
         """
         failure_threshold: The failure threshold at which the circuit will break (a number between 0 and 1)
         break_duration: The duration the circuit will stay open before resetting
         minimum_throughput: How many actions must pass through the circuit breaker to come into action
         sampling_duration: The duration when failure ratios are assessed
+        max_scopes: How many scopes are tracked at most, the least recently used ones are forgotten
+
+        The circuit breaker is meant to be used from a single event loop: its state only changes in synchronous
+        code between awaits, so concurrent operations cannot lose updates and no locking is needed.
         """
         if break_duration <= 0:
             raise RuntimeError("Break duration should be positive")
@@ -140,15 +190,19 @@ class DefaultCircuitBreaker(CircuitBreaker[TScope, TResult]):
             raise RuntimeError("Sample duration should be positive")
         if windows_count <= 0:
             raise RuntimeError("Windows count should be positive")
+        if max_scopes <= 0:
+            raise RuntimeError("Max scopes should be positive")
 
-        self.__break_duration = break_duration
+        self.__break_duration_ns = int(break_duration * 1e9)
         self.__minimum_throughput = minimum_throughput
-        self.__failure_threshold = failure_threshold
-        self.__per_scope_metrics = collections.defaultdict[TScope, CircuitBreakerMetrics](
-            lambda: RollingCircuitBreakerMetrics(sampling_duration, windows_count)
-        )
-        self.__per_scope_state = collections.defaultdict[TScope, CircuitState](lambda: CircuitState.CLOSED)
-        self.__per_scope_blocked_till = collections.defaultdict[TScope, float](float)
+        # The threshold is kept as an exact decimal ratio to compare failure ratios without a float division
+        failure_threshold_ratio = fractions.Fraction(str(failure_threshold))
+        self.__failure_threshold_numerator = failure_threshold_ratio.numerator
+        self.__failure_threshold_denominator = failure_threshold_ratio.denominator
+        self.__sampling_duration = sampling_duration
+        self.__windows_count = windows_count
+        self.__max_scopes = max_scopes
+        self.__scopes = collections.OrderedDict[TScope, _ScopeEntry]()
 
     async def execute(
         self,
@@ -158,73 +212,83 @@ class DefaultCircuitBreaker(CircuitBreaker[TScope, TResult]):
         fallback: TResult,
         is_successful: collections.abc.Callable[[TResult], bool],
     ) -> TResult:
-        if not self._is_executable(scope):
-            return fallback
+        entry = self.__scopes.get(scope)
+        if entry is None:
+            entry = self._create_entry(scope)
+        else:
+            self.__scopes.move_to_end(scope)
+            if entry.state is not _CLOSED and not self._is_executable(entry):
+                return fallback
 
+        # The outcome is judged against the state the operation was let through in
+        state, generation = entry.state, entry.generation
         result = await operation()
+        if entry.generation != generation:
+            # The circuit has changed its state while the operation was running, so its outcome is stale
+            return result
 
+        now = time.monotonic_ns()
         if is_successful(result):
-            self._on_success(scope)
+            self._on_success(entry, state, now)
         else:
-            self._on_failure(scope)
+            self._on_failure(entry, state, now)
 
         return result
 
     @property
     def state(self) -> collections.abc.Mapping[TScope, CircuitState]:
-        return dict(self.__per_scope_state)
+        return {scope: entry.state for scope, entry in self.__scopes.items()}
 
-    def _is_executable(self, scope: TScope) -> bool:
-        state = self.__per_scope_state[scope]
-        if state == CircuitState.CLOSED:
+    def _create_entry(self, scope: TScope) -> _ScopeEntry:
+        entry = _ScopeEntry(metrics=RollingCircuitBreakerMetrics(self.__sampling_duration, self.__windows_count))
+        self.__scopes[scope] = entry
+        if len(self.__scopes) > self.__max_scopes:
+            self.__scopes.popitem(last=False)
+        return entry
+
+    def _is_executable(self, entry: _ScopeEntry) -> bool:
+        if entry.state is _CLOSED:
             return True
 
-        blocked_till = self.__per_scope_blocked_till[scope]
-        now = time.time()
-        if blocked_till > now:
+        now = time.monotonic_ns()
+        if entry.blocked_till > now:
             return False
 
         # Only one operation should win and be executed
-        self.__per_scope_blocked_till[scope] = now + self.__break_duration
-        self.__per_scope_state[scope] = CircuitState.HALF_OPEN
+        entry.blocked_till = now + self.__break_duration_ns
+        entry.state = _HALF_OPEN
+        entry.generation += 1
         return True
 
-    def _on_success(self, scope: TScope) -> None:
-        state = self.__per_scope_state[scope]
-        if state == CircuitState.HALF_OPEN:
-            self._close(scope)
-        self.__per_scope_metrics[scope].increment_successes()
-
-    def _on_failure(self, scope: TScope) -> None:
-        state = self.__per_scope_state[scope]
-        if state == CircuitState.CLOSED:
-            self._increment_failures(scope)
-            snapshot = self._collect_metrics(scope)
-            throughput = float(snapshot.successes + snapshot.failures)
-            if throughput >= self.__minimum_throughput and (snapshot.failures / throughput >= self.__failure_threshold):
-                self._open(scope)
-        elif state == CircuitState.OPEN:
-            self._increment_failures(scope)
+    def _on_success(self, entry: _ScopeEntry, state: CircuitState, now: int) -> None:
+        if state is _HALF_OPEN:
+            self._close(entry)
+        entry.metrics.increment_successes(now)
+
+    def _on_failure(self, entry: _ScopeEntry, state: CircuitState, now: int) -> None:
+        if state is _CLOSED:
+            entry.metrics.increment_failures(now)
+            _, successes, failures = entry.metrics.collect(now)
+            throughput = successes + failures
+            if (
+                throughput >= self.__minimum_throughput
+                and failures * self.__failure_threshold_denominator >= self.__failure_threshold_numerator * throughput
+            ):
+                self._open(entry, now)
         else:
-            self._open(scope)
-
-    def _increment_failures(self, scope: TScope) -> None:
-        self.__per_scope_metrics[scope].increment_failures()
-
-    def _increment_successes(self, scope: TScope) -> None:
-        self.__per_scope_metrics[scope].increment_successes()
-
-    def _collect_metrics(self, scope: TScope) -> CircuitBreakerMetricsSnapshot:
-        return self.__per_scope_metrics[scope].collect()
-
-    def _close(self, scope: TScope) -> None:
-        self.__per_scope_metrics[scope].reset()
-        self.__per_scope_state[scope] = CircuitState.CLOSED
-        self.__per_scope_blocked_till[scope] = 0
-
-    def _open(self, scope: TScope) -> None:
-        self.__per_scope_blocked_till[scope] = time.time() + self.__break_duration
-        self.__per_scope_state[scope] = CircuitState.OPEN
+            # Only the single operation let through a half-open circuit gets here
+            self._open(entry, now)
+
+    def _close(self, entry: _ScopeEntry) -> None:
+        entry.metrics.reset()
+        entry.state = _CLOSED
+        entry.blocked_till = 0
+        entry.generation += 1
+
+    def _open(self, entry: _ScopeEntry, now: int) -> None:
+        entry.blocked_till = now + self.__break_duration_ns
+        entry.state = _OPEN
+        entry.generation += 1
 
 
 class NoopCircuitBreaker(CircuitBreaker[TScope, TResult]):
@@ -2,20 +2,24 @@ import asyncio
 import collections.abc
 import contextlib
 import time
+import types
 
 import yarl
 
-from .base import ClosableResponse, Header, Request, Response
+from .base import ClosableResponse, Request, Response
 from .context import get_context
 from .deadline import Deadline
 from .endpoint_provider import EndpointProvider
 from .priority import Priority
 from .request_strategy import RequestStrategy, ResponseWithVerdict
 from .response_classifier import ResponseClassifier
+from .utils import get_endpoint_label, get_labelled_metric, get_status_label
 
 try:
     import prometheus_client as prom
 
+    metrics_enabled = True
+
     latency_histogram = prom.Histogram(
         "aio_request_latency",
         "Duration of client requests.",
@@ -51,22 +55,18 @@ try:
     )
 
     def capture_metrics(
-        *, endpoint: yarl.URL, request: Request, status: int, circuit_breaker: bool, started_at: float
+        *, request_label_values: tuple[str, str, str], status: int, circuit_breaker: bool, started_at: int
     ) -> None:
-        label_values = (
-            endpoint.human_repr(),
-            request.method,
-            request.url.path,
-            str(status),
-            str(circuit_breaker),
-        )
-        elapsed = max(0.0, time.perf_counter() - started_at)
-        latency_histogram.labels(*label_values).observe(elapsed)
+        label_values = (*request_label_values, get_status_label(status), str(circuit_breaker))
+        elapsed_ns = time.perf_counter_ns() - started_at
+        get_labelled_metric(latency_histogram, label_values).observe(elapsed_ns / 1e9)
 
 except ImportError:
+    # Callers check the flag to skip preparing label values nobody is going to observe
+    metrics_enabled = False
 
     def capture_metrics(
-        *, endpoint: yarl.URL, request: Request, status: int, circuit_breaker: bool, started_at: float
+        *, request_label_values: tuple[str, str, str], status: int, circuit_breaker: bool, started_at: int
     ) -> None:
         pass
 
@@ -79,6 +79,7 @@ class Client:
         "__priority",
         "__timeout",
         "__send_request",
+        "__bound_send",
     )
 
     def __init__(
@@ -93,49 +94,31 @@ class Client:
             [yarl.URL, Request, Deadline, Priority], collections.abc.Awaitable[ClosableResponse]
         ],
     ):
+        if timeout < 0:
+            raise ValueError("timeout cannot be negative")
+
         self.__endpoint_provider = endpoint_provider
         self.__response_classifier = response_classifier
         self.__request_strategy = request_strategy
         self.__priority = priority
         self.__timeout = timeout
         self.__send_request = send_request
+        # Strategies get the same bound method every time instead of a new one per request
+        self.__bound_send = self.__send
 
-    @contextlib.asynccontextmanager
-    async def request(
+    def request(
         self,
         request: Request,
         *,
         deadline: Deadline | None = None,
         priority: Priority | None = None,
         strategy: RequestStrategy | None = None,
-    ) -> collections.abc.AsyncIterator[Response]:
-        started_at = time.perf_counter()
-        endpoint = await self.__endpoint_provider.get()
-        try:
-            response_ctx = self._request(
-                endpoint=endpoint, request=request, deadline=deadline, priority=priority, strategy=strategy
-            )
-            async with response_ctx as response:
-                capture_metrics(
-                    endpoint=endpoint,
-                    request=request,
-                    status=response.status,
-                    circuit_breaker=Header.X_CIRCUIT_BREAKER in response.headers,
-                    started_at=started_at,
-                )
-                yield response
-        except asyncio.CancelledError:
-            capture_metrics(
-                endpoint=endpoint,
-                request=request,
-                status=499,
-                circuit_breaker=False,
-                started_at=started_at,
-            )
-            raise
+    ) -> contextlib.AbstractAsyncContextManager[Response]:
+        return _RequestContextManager(
+            self, self.__endpoint_provider, request, deadline=deadline, priority=priority, strategy=strategy
+        )
 
-    @contextlib.asynccontextmanager
-    async def _request(
+    def _request(
         self,
         *,
         endpoint: yarl.URL,
@@ -143,17 +126,16 @@ class Client:
         deadline: Deadline | None = None,
         priority: Priority | None = None,
         strategy: RequestStrategy | None = None,
-    ) -> collections.abc.AsyncIterator[Response]:
+    ) -> contextlib.AbstractAsyncContextManager[ResponseWithVerdict[Response]]:
         context = get_context()
-        response_ctx = (strategy or self.__request_strategy).request(
-            self.__send,
+        return (strategy or self.__request_strategy).request(
+            self.__bound_send,
             endpoint,
             request,
-            deadline or context.deadline or Deadline.from_timeout(self.__timeout),
+            # The default timeout has been validated once, so the deadline is built without from_timeout checks
+            deadline or context.deadline or Deadline(started_at=time.perf_counter(), seconds=self.__timeout),
             self.__normalize_priority(priority or self.__priority, context.priority),
         )
-        async with response_ctx as response_with_verdict:
-            yield response_with_verdict.response
 
     async def __send(
         self,
@@ -170,10 +152,103 @@ class Client:
         if context_priority is None:
             return priority
 
-        if priority == Priority.LOW and context_priority == Priority.HIGH:
-            return Priority.NORMAL
+        return _NORMALIZED_PRIORITIES.get((priority, context_priority), priority)
+
+
+class _RequestContextManager:
+    # Measures a request and unwraps the response of the strategy context in a single frame per request,
+    # instead of nesting generator-based context managers
+    __slots__ = (
+        "__client",
+        "__endpoint_provider",
+        "__request",
+        "__deadline",
+        "__priority",
+        "__strategy",
+        "__started_at",
+        "__request_label_values",
+        "__response_ctx",
+    )
+
+    def __init__(
+        self,
+        client: Client,
+        endpoint_provider: EndpointProvider,
+        request: Request,
+        *,
+        deadline: Deadline | None,
+        priority: Priority | None,
+        strategy: RequestStrategy | None,
+    ):
+        self.__client = client
+        self.__endpoint_provider = endpoint_provider
+        self.__request = request
+        self.__deadline = deadline
+        self.__priority = priority
+        self.__strategy = strategy
+
+    async def __aenter__(self) -> Response:
+        self.__started_at = time.perf_counter_ns()
+        endpoint = self.__endpoint_provider.get_nowait()
+        if endpoint is None:
+            endpoint = await self.__endpoint_provider.get()
+        request = self.__request
+        self.__response_ctx = self.__client._request(
+            endpoint=endpoint,
+            request=request,
+            deadline=self.__deadline,
+            priority=self.__priority,
+            strategy=self.__strategy,
+        )
+        if not metrics_enabled:
+            return (await self.__response_ctx.__aenter__()).response
+
+        # A request cancelled while its response is in use is observed twice, so its labels are built once
+        self.__request_label_values = (get_endpoint_label(endpoint), request.method, request.url.path)
+        try:
+            response = (await self.__response_ctx.__aenter__()).response
+        except asyncio.CancelledError:
+            self.__capture_cancellation()
+            raise
+
+        capture_metrics(
+            request_label_values=self.__request_label_values,
+            status=response.status,
+            circuit_breaker=response.circuit_breaker,
+            started_at=self.__started_at,
+        )
+        return response
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> bool | None:
+        if not metrics_enabled:
+            return await self.__response_ctx.__aexit__(exc_type, exc_val, exc_tb)
+
+        try:
+            suppressed = await self.__response_ctx.__aexit__(exc_type, exc_val, exc_tb)
+        except asyncio.CancelledError:
+            self.__capture_cancellation()
+            raise
+
+        if not suppressed and exc_type is not None and issubclass(exc_type, asyncio.CancelledError):
+            self.__capture_cancellation()
+        return suppressed
+
+    def __capture_cancellation(self) -> None:
+        capture_metrics(
+            request_label_values=self.__request_label_values,
+            status=499,
+            circuit_breaker=False,
+            started_at=self.__started_at,
+        )
 
-        if priority == Priority.HIGH and context_priority == Priority.LOW:
-            return Priority.NORMAL
 
-        return priority
+# Request and context priorities pulling in opposite directions meet in the middle, others keep the request one
+_NORMALIZED_PRIORITIES = {
+    (Priority.LOW, Priority.HIGH): Priority.NORMAL,
+    (Priority.HIGH, Priority.LOW): Priority.NORMAL,
+}
@@ -24,10 +24,13 @@ class Context:
         deadline: Deadline | UseClientDefault | None = USE_CLIENT_DEFAULT,
         priority: Priority | UseClientDefault | None = USE_CLIENT_DEFAULT,
     ) -> "Context":
-        return Context(
-            deadline=self.deadline if isinstance(deadline, UseClientDefault) else deadline,
-            priority=self.priority if isinstance(priority, UseClientDefault) else priority,
-        )
+        if isinstance(deadline, UseClientDefault):
+            deadline = self.deadline
+        if isinstance(priority, UseClientDefault):
+            priority = self.priority
+        if deadline is self.deadline and priority is self.priority:
+            return self
+        return Context(deadline=deadline, priority=priority)
 
     def __repr__(self) -> str:
         return f"<Context [{self.deadline} {self.priority}]>"
@@ -42,7 +45,13 @@ def set_context(
     deadline: Deadline | UseClientDefault | None = USE_CLIENT_DEFAULT,
     priority: Priority | UseClientDefault | None = USE_CLIENT_DEFAULT,
 ) -> collections.abc.Iterator[None]:
-    reset_token = context_var.set(context_var.get().set(deadline=deadline, priority=priority))
+    current_context = context_var.get()
+    context = current_context.set(deadline=deadline, priority=priority)
+    if context is current_context:
+        yield
+        return
+
+    reset_token = context_var.set(context)
     try:
         yield
     finally:
@@ -11,6 +11,12 @@ class EndpointProvider(abc.ABC):
     @abc.abstractmethod
     async def get(self) -> yarl.URL: ...
 
+    def get_nowait(self) -> yarl.URL | None:
+        """
+        Returns the endpoint if it is known without awaiting, otherwise None and get() should be awaited
+        """
+        return None
+
 
 class StaticEndpointProvider(EndpointProvider):
     __slots__ = ("__endpoint",)
@@ -21,6 +27,9 @@ class StaticEndpointProvider(EndpointProvider):
     async def get(self) -> yarl.URL:
         return self.__endpoint
 
+    def get_nowait(self) -> yarl.URL | None:
+        return self.__endpoint
+
 
 EndpointDelegate = collections.abc.Callable[[], str | yarl.URL]
 AsyncEndpointDelete = collections.abc.Callable[[], collections.abc.Awaitable[str | yarl.URL]]
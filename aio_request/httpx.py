@@ -27,15 +27,16 @@ except ImportError:
 
 
 from .base import (
+    ClosableResponse,
     EmptyResponse,
     Header,
+    Request,
     UnexpectedContentTypeError,
     build_query_parameters,
     is_expected_content_type,
     substitute_path_parameters,
 )
-from .request import Request
-from .transport import ClosableResponse, Transport
+from .transport import Transport
 
 logger = logging.getLogger(__package__)
 
@@ -45,7 +46,7 @@ class HttpxTransport(Transport):
         "__client",
         "__buffer_payload",
         "__too_many_redirects_code",
-        "__network_errors_code",
+        "__network_error_response",
     )
 
     def __init__(
@@ -58,7 +59,8 @@ class HttpxTransport(Transport):
         self.__client = client
         self.__buffer_payload = buffer_payload
         self.__too_many_redirects_code = too_many_redirects_code
-        self.__network_errors_code = network_errors_code
+        # A response without headers cannot change, so it is created once per transport
+        self.__network_error_response = EmptyResponse(status=network_errors_code)
 
     async def send(self, endpoint: yarl.URL, request: Request, timeout: float) -> ClosableResponse:
         if not endpoint.is_absolute():
@@ -119,14 +121,15 @@ class HttpxTransport(Transport):
                     "request_url": url,
                 },
             )
-            return EmptyResponse(status=self.__network_errors_code)
+            return self.__network_error_response
 
 
 class _HttpxResponse(ClosableResponse):
-    __slots__ = ("__response",)
+    __slots__ = ("__response", "__headers")
 
     def __init__(self, response: httpx.Response):
         self.__response = response
+        self.__headers: multidict.CIMultiDictProxy[str] | None = None
 
     async def close(self) -> None:
         await self.__response.aclose()
@@ -137,7 +140,20 @@ class _HttpxResponse(ClosableResponse):
 
     @property
     def headers(self) -> multidict.CIMultiDictProxy[str]:
-        return multidict.CIMultiDictProxy[str](multidict.CIMultiDict[str](self.__response.headers.multi_items()))
+        # Response headers never change, so the conversion is done at most once
+        if self.__headers is None:
+            self.__headers = multidict.CIMultiDictProxy[str](
+                multidict.CIMultiDict[str](self.__response.headers.multi_items())
+            )
+        return self.__headers
+
+    @property
+    def content_type(self) -> str | None:
+        return self.__response.headers.get(Header.CONTENT_TYPE)
+
+    @property
+    def circuit_breaker(self) -> bool:
+        return Header.X_CIRCUIT_BREAKER in self.__response.headers
 
     async def json(
         self,
@@ -147,7 +163,7 @@ class _HttpxResponse(ClosableResponse):
         content_type: str | None = "application/json",
     ) -> Any:
         if content_type is not None:
-            response_content_type = self.__response.headers.get(Header.CONTENT_TYPE, "").lower()
+            response_content_type = self.__response.headers.get(Header.CONTENT_TYPE, "")
             if not is_expected_content_type(response_content_type, content_type):
                 raise UnexpectedContentTypeError(f"Expected {content_type}, actual {response_content_type}")
 
@@ -13,6 +13,7 @@ from .priority import Priority
 from .request import AsyncRequestEnricher, RequestEnricher
 from .response_classifier import ResponseClassifier, ResponseVerdict
 from .transport import Transport
+from .utils import get_endpoint_label, get_labelled_metric, get_status_label
 
 try:
     import prometheus_client as prom
@@ -50,19 +51,19 @@ try:
         ),
     )
 
-    def capture_metrics(*, endpoint: yarl.URL, request: Request, status: int, started_at: float) -> None:
+    def capture_metrics(*, endpoint: yarl.URL, request: Request, status: int, started_at: int) -> None:
         label_values = (
-            endpoint.human_repr(),
+            get_endpoint_label(endpoint),
             request.method,
             request.url.path,
-            str(status),
+            get_status_label(status),
         )
-        elapsed = max(0.0, time.perf_counter() - started_at)
-        latency_histogram.labels(*label_values).observe(elapsed)
+        elapsed_ns = time.perf_counter_ns() - started_at
+        get_labelled_metric(latency_histogram, label_values).observe(elapsed_ns / 1e9)
 
 except ImportError:
 
-    def capture_metrics(*, endpoint: yarl.URL, request: Request, status: int, started_at: float) -> None:
+    def capture_metrics(*, endpoint: yarl.URL, request: Request, status: int, started_at: int) -> None:
         pass
 
 
@@ -123,7 +124,9 @@ class LowTimeoutModule(RequestModule):
         deadline: Deadline,
         priority: Priority,
     ) -> ClosableResponse:
-        if deadline.expired or deadline.timeout < self.__low_timeout_threshold:
+        # A single clock read covers both checks: the timeout of an expired deadline is 0
+        timeout = deadline.timeout
+        if timeout <= 0 or timeout < self.__low_timeout_threshold:
             return self.__timeout_response
 
         return await next(endpoint, request, deadline, priority)
@@ -154,10 +157,10 @@ class TransportModule(RequestModule):
     ) -> ClosableResponse:
         if self.__emit_system_headers:
             request = request.update_headers(
-                {
-                    Header.X_REQUEST_PRIORITY: str(priority),
-                    Header.X_REQUEST_TIMEOUT: str(deadline.timeout),
-                }
+                (
+                    (Header.X_REQUEST_PRIORITY, str(priority)),
+                    (Header.X_REQUEST_TIMEOUT, str(deadline.timeout)),
+                )
             )
 
         if self.__request_enricher is not None:
@@ -166,7 +169,7 @@ class TransportModule(RequestModule):
                 enriched_request = await enriched_request
             request = enriched_request  # type: ignore
 
-        started_at = time.perf_counter()
+        started_at = time.perf_counter_ns()
         try:
             response = await self.__transport.send(endpoint, request, deadline.timeout)
             capture_metrics(endpoint=endpoint, request=request, status=response.status, started_at=started_at)
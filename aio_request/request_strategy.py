@@ -17,6 +17,8 @@ from .utils import Closable, cancel_futures, close, close_futures, close_single
 TResponse = TypeVar("TResponse")
 
 
+# Instances should be created without subscripting the class: calling a parametrized alias
+# also tries to set __orig_class__, which raises and swallows an AttributeError because of slots
 class ResponseWithVerdict(Generic[TResponse], Closable):
     __slots__ = ("response", "verdict")
 
@@ -111,7 +113,7 @@ class SingleAttemptRequestStrategy(RequestStrategy):
         send_result: ResponseWithVerdict[ClosableResponse] | None = None
         try:
             send_result = await send_request(endpoint, request, deadline, priority)
-            yield ResponseWithVerdict[Response](send_result.response, send_result.verdict)
+            yield ResponseWithVerdict(send_result.response, send_result.verdict)
         finally:
             if send_result is not None:
                 await asyncio.shield(close_single(send_result))
@@ -156,7 +158,7 @@ class SequentialRequestStrategy(RequestStrategy):
                 attempt_deadline = self.__deadline_provider(deadline, attempt, self.__attempts_count)
                 response = await send_request(endpoint, request, attempt_deadline, priority)
                 responses.append(response)
-                if response.verdict == ResponseVerdict.ACCEPT:
+                if response.verdict is ResponseVerdict.ACCEPT:
                     break
                 if attempt + 1 == self.__attempts_count:
                     break
@@ -165,7 +167,7 @@ class SequentialRequestStrategy(RequestStrategy):
                     break
                 await asyncio.sleep(retry_delay)
             final_response = responses[-1]
-            yield ResponseWithVerdict[Response](final_response.response, final_response.verdict)
+            yield ResponseWithVerdict(final_response.response, final_response.verdict)
         finally:
             await asyncio.shield(close(responses))
 
@@ -217,7 +219,7 @@ class ParallelRequestStrategy(RequestStrategy):
                     while completed_tasks:
                         completed_task = completed_tasks.pop()
                         response = await completed_task
-                        if response.verdict == ResponseVerdict.ACCEPT:
+                        if response.verdict is ResponseVerdict.ACCEPT:
                             accepted_responses.append(response)
                         else:
                             not_accepted_responses.append(response)
@@ -227,7 +229,7 @@ class ParallelRequestStrategy(RequestStrategy):
                 await asyncio.shield(cancel_futures(pending_tasks))
 
             final_response = accepted_responses[0] if accepted_responses else not_accepted_responses[0]
-            yield ResponseWithVerdict[Response](final_response.response, final_response.verdict)
+            yield ResponseWithVerdict(final_response.response, final_response.verdict)
         finally:
             await asyncio.shield(
                 asyncio.gather(
@@ -274,7 +276,7 @@ class RetryUntilDeadlineExpiredStrategy(RequestStrategy):
         while True:
             response_ctx = self.__base_strategy.request(send_request, endpoint, request, deadline, priority)
             async with response_ctx as response:
-                if response.verdict == ResponseVerdict.ACCEPT or deadline.expired:
+                if response.verdict is ResponseVerdict.ACCEPT or deadline.expired:
                     yield response
                     return
 
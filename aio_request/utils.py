@@ -2,8 +2,11 @@ import abc
 import asyncio
 import collections.abc
 import contextlib
+import functools
 from typing import TypeVar
 
+import yarl
+
 
 class Closable(abc.ABC):
     __slots__ = ()
@@ -56,3 +59,31 @@ def try_parse_float(value: str | None) -> float | None:
         return float(value)
     except ValueError:
         return None
+
+
+@functools.lru_cache(maxsize=1024)
+def get_endpoint_label(endpoint: yarl.URL) -> str:
+    # Endpoints come from a small set, while human_repr() re-quotes every URL part on each call
+    return endpoint.human_repr()
+
+
+# Response statuses come from a small range, so their labels are converted to strings once
+_STATUS_LABELS = tuple(str(status) for status in range(600))
+
+
+def get_status_label(status: int) -> str:
+    return _STATUS_LABELS[status] if 0 <= status < 600 else str(status)
+
+
+TMetric = TypeVar("TMetric")
+
+
+def get_labelled_metric(metric: TMetric, label_values: tuple[str, ...]) -> TMetric:
+    # labels() locks and validates every value on each call, so an existing child is taken straight
+    # from the metric's own children, which also stops returning children dropped by clear() or remove().
+    # The children are private to prometheus_client, so labels() is used whenever they are not found there.
+    children = getattr(metric, "_metrics", None)
+    child = children.get(label_values) if isinstance(children, dict) else None
+    if child is None:
+        child = metric.labels(*label_values)  # type: ignore[attr-defined]
+    return child
@@ -4,6 +4,41 @@ import pytest
 import aio_request
 
 
+async def test_match_request():
+    match aio_request.get("users/{id}", path_parameters={"id": 1}):
+        case aio_request.Request(aio_request.Method.GET, url, path_parameters={"id": user_id}):
+            assert url.path == "users/{id}"
+            assert user_id == 1
+        case _:
+            pytest.fail("Request should match")
+
+
+async def test_absolute_url_is_rejected():
+    with pytest.raises(RuntimeError):
+        aio_request.get("https://site.com/get")
+
+
+async def test_update_headers_keeps_request():
+    request = aio_request.post(
+        "get/{id}",
+        b"body",
+        path_parameters={"id": 1},
+        query_parameters={"a": "b"},
+        allow_redirects=False,
+        max_redirects=1,
+    )
+    updated_request = request.update_headers({"c": "d"})
+
+    assert updated_request is not request
+    assert updated_request.method == request.method
+    assert updated_request.url == request.url
+    assert updated_request.path_parameters == request.path_parameters
+    assert updated_request.query_parameters == request.query_parameters
+    assert updated_request.body == request.body
+    assert updated_request.allow_redirects == request.allow_redirects
+    assert updated_request.max_redirects == request.max_redirects
+
+
 async def test_update_headers():
     request = aio_request.get("get", headers={"a": "b", "x": "y"})
     request = request.update_headers({"c": "d", "x": "z"})
@@ -11,6 +46,27 @@ async def test_update_headers():
     assert request.headers == {"a": "b", "c": "d", "x": "z"}
 
 
+async def test_update_headers_with_items():
+    request = aio_request.get("get", headers={"a": "b", "x": "y"})
+    request = request.update_headers(((aio_request.Header.X_REQUEST_PRIORITY, "high"), ("X", "z")))
+
+    assert request.headers == multidict.CIMultiDict([("a", "b"), ("x", "z"), ("x-request-priority", "high")])
+
+
+async def test_update_headers_without_headers():
+    request = aio_request.get("get")
+    request = request.update_headers({"c": "d", "x": "z"})
+
+    assert request.headers == {"c": "d", "x": "z"}
+
+
+async def test_update_headers_with_empty_headers():
+    request = aio_request.get("get", headers={"a": "b"})
+
+    assert request.update_headers({}) is request
+    assert request.extend_headers(()) is request
+
+
 async def test_extend_headers():
     request = aio_request.get("get", headers={"a": "b", "x": "y"})
     request = request.extend_headers({"c": "d", "x": "z"})
@@ -18,6 +74,13 @@ async def test_extend_headers():
     assert request.headers == multidict.CIMultiDict([("a", "b"), ("x", "y"), ("c", "d"), ("x", "z")])
 
 
+async def test_extend_headers_without_headers():
+    request = aio_request.get("get")
+    request = request.extend_headers((("x", "y"), ("x", "z")))
+
+    assert request.headers == multidict.CIMultiDict([("x", "y"), ("x", "z")])
+
+
 @pytest.mark.parametrize(
     "is_json, response_content_type, content_type",
     [
@@ -27,6 +90,12 @@ async def test_extend_headers():
         (True, "application/problem+json", "application/json"),
         (True, "application/json;charset=uft-8", "application/json"),
         (True, "application/problem+json;charset=uft-8", "application/json"),
+        (True, "Application/JSON", "application/json"),
+        (True, "application/vnd.api+json ; charset=utf-8", "application/json"),
+        (False, "text/json", "application/json"),
+        (False, "application/json-patch", "application/json"),
+        (False, "application/+json", "application/json"),
+        (False, "application/a b+json", "application/json"),
     ],
 )
 async def test_response_is_json(is_json: bool, response_content_type: str, content_type: str):
@@ -37,3 +106,33 @@ async def test_response_is_json(is_json: bool, response_content_type: str, conte
         headers=multidict.CIMultiDictProxy[str](headers),
     )
     assert is_json == response.is_json
+
+
+async def test_empty_response_has_empty_body():
+    response = aio_request.EmptyResponse(status=408)
+
+    assert await response.read() == b""
+    assert await response.text() == ""
+    assert await response.json(content_type=None) is None
+
+
+async def test_empty_response_json_checks_content_type_case_insensitively():
+    headers = multidict.CIMultiDict[str]({"Content-Type": "Text/Plain; charset=utf-8"})
+    response = aio_request.EmptyResponse(status=200, headers=multidict.CIMultiDictProxy[str](headers))
+
+    assert await response.json(content_type="text/plain") is None
+    with pytest.raises(aio_request.UnexpectedContentTypeError, match="Text/Plain"):
+        await response.json()
+
+
+async def test_empty_response_subclass():
+    class TimeoutResponse(aio_request.EmptyResponse):
+        __slots__ = ("reason",)
+
+        def __init__(self, reason: str):
+            super().__init__(status=408)
+            self.reason = reason
+
+    response = TimeoutResponse("slow")
+    assert response.status == 408
+    assert response.reason == "slow"
@@ -1,5 +1,8 @@
 import asyncio
 import collections.abc
+import time
+
+import pytest
 
 import aio_request
 
@@ -71,6 +74,62 @@ async def test_half_open_to_open() -> None:
     assert circuit_breaker.state == {"scope": aio_request.CircuitState.OPEN}
 
 
+async def test_open_circuit_is_checked_when_awaited() -> None:
+    circuit_breaker = aio_request.DefaultCircuitBreaker[str, int](
+        break_duration=0.3,
+        sampling_duration=1.0,
+        minimum_throughput=2,
+        failure_threshold=0.5,
+        windows_count=1,
+    )
+    assert await circuit_breaker.execute(scope="scope", operation=do(500), fallback=503, is_successful=is_200) == 500
+    assert await circuit_breaker.execute(scope="scope", operation=do(500), fallback=503, is_successful=is_200) == 500
+    assert (
+        await asyncio.create_task(
+            circuit_breaker.execute(scope="scope", operation=do(200), fallback=503, is_successful=is_200)
+        )
+        == 503
+    )
+
+    await asyncio.sleep(0.3)  # wait break_duration
+    never_awaited = circuit_breaker.execute(scope="scope", operation=do(200), fallback=503, is_successful=is_200)
+    never_awaited.close()
+    assert circuit_breaker.state == {"scope": aio_request.CircuitState.OPEN}
+
+    assert await circuit_breaker.execute(scope="scope", operation=do(200), fallback=503, is_successful=is_200) == 200
+    assert circuit_breaker.state == {"scope": aio_request.CircuitState.CLOSED}
+
+
+async def test_stale_outcome_does_not_change_half_open_state() -> None:
+    circuit_breaker = aio_request.DefaultCircuitBreaker[str, int](
+        break_duration=0.3,
+        sampling_duration=1.0,
+        minimum_throughput=2,
+        failure_threshold=0.5,
+        windows_count=1,
+    )
+    stale_task = asyncio.create_task(
+        circuit_breaker.execute(scope="scope", operation=delay(200, seconds=0.5), fallback=503, is_successful=is_200)
+    )
+    await asyncio.sleep(0)
+    assert await circuit_breaker.execute(scope="scope", operation=do(500), fallback=503, is_successful=is_200) == 500
+    assert await circuit_breaker.execute(scope="scope", operation=do(500), fallback=503, is_successful=is_200) == 500
+    assert circuit_breaker.state == {"scope": aio_request.CircuitState.OPEN}
+
+    await asyncio.sleep(0.35)  # wait break_duration
+    delayed_task = asyncio.create_task(
+        circuit_breaker.execute(scope="scope", operation=delay(500, seconds=0.5), fallback=503, is_successful=is_200)
+    )
+    await asyncio.sleep(0)
+    assert circuit_breaker.state == {"scope": aio_request.CircuitState.HALF_OPEN}
+
+    assert await stale_task == 200  # started while the circuit was closed
+    assert circuit_breaker.state == {"scope": aio_request.CircuitState.HALF_OPEN}
+
+    assert await delayed_task == 500
+    assert circuit_breaker.state == {"scope": aio_request.CircuitState.OPEN}
+
+
 async def test_circuit_breaker_should_be_closed_because_of_metrics_expire() -> None:
     circuit_breaker = aio_request.DefaultCircuitBreaker[str, int](
         break_duration=1.0,
@@ -141,3 +200,88 @@ async def test_circuit_breaker_should_be_open_after_failure() -> None:
 
     assert await circuit_breaker.execute(scope="scope", operation=do(500), fallback=503, is_successful=is_200) == 500
     assert circuit_breaker.state == {"scope": aio_request.CircuitState.OPEN}
+
+
+async def test_rolling_metrics_reuse_expired_windows() -> None:
+    metrics = aio_request.RollingCircuitBreakerMetrics(sampling_duration=0.2, windows_count=2)
+
+    metrics.increment_failures()
+    metrics.increment_successes()
+    snapshot = metrics.collect()
+    assert (snapshot.successes, snapshot.failures) == (1, 1)
+
+    for _ in range(3):
+        await asyncio.sleep(0.2)  # wait sampling_duration for expiration of metrics
+
+        snapshot = metrics.collect()
+        assert (snapshot.successes, snapshot.failures) == (0, 0)
+
+        metrics.increment_failures()
+        snapshot = metrics.collect()
+        assert (snapshot.successes, snapshot.failures) == (0, 1)
+
+    metrics.reset()
+    snapshot = metrics.collect()
+    assert (snapshot.successes, snapshot.failures) == (0, 0)
+
+
+async def test_noop_circuit_breaker_passes_operation_through() -> None:
+    circuit_breaker = aio_request.NoopCircuitBreaker[str, int]()
+
+    assert await circuit_breaker.execute(scope="scope", operation=do(500), fallback=503, is_successful=is_200) == 500
+    assert (
+        await asyncio.create_task(
+            circuit_breaker.execute(scope="scope", operation=do(200), fallback=503, is_successful=is_200)
+        )
+        == 200
+    )
+    assert circuit_breaker.state == {}
+
+
+async def test_least_recently_used_scopes_are_forgotten() -> None:
+    circuit_breaker = aio_request.DefaultCircuitBreaker[str, int](
+        break_duration=1.0,
+        sampling_duration=1.0,
+        minimum_throughput=2,
+        failure_threshold=0.5,
+        max_scopes=2,
+    )
+
+    for scope in ("a", "b", "a", "c"):
+        assert await circuit_breaker.execute(scope=scope, operation=do(200), fallback=503, is_successful=is_200) == 200
+
+    assert circuit_breaker.state == {"a": aio_request.CircuitState.CLOSED, "c": aio_request.CircuitState.CLOSED}
+
+
+async def test_circuit_breaker_should_be_opened_at_failure_threshold() -> None:
+    circuit_breaker = aio_request.DefaultCircuitBreaker[str, int](
+        break_duration=1.0,
+        sampling_duration=5.0,
+        minimum_throughput=10,
+        failure_threshold=0.1,
+    )
+
+    for _ in range(9):
+        assert (
+            await circuit_breaker.execute(scope="scope", operation=do(200), fallback=503, is_successful=is_200) == 200
+        )
+    assert await circuit_breaker.execute(scope="scope", operation=do(500), fallback=503, is_successful=is_200) == 500
+    assert circuit_breaker.state == {"scope": aio_request.CircuitState.OPEN}
+
+
+async def test_circuit_breaker_ignores_wall_clock_jumps(monkeypatch: pytest.MonkeyPatch) -> None:
+    circuit_breaker = aio_request.DefaultCircuitBreaker[str, int](
+        break_duration=1.0,
+        sampling_duration=1.0,
+        minimum_throughput=2,
+        failure_threshold=0.5,
+    )
+    assert await circuit_breaker.execute(scope="scope", operation=do(500), fallback=503, is_successful=is_200) == 500
+    assert await circuit_breaker.execute(scope="scope", operation=do(500), fallback=503, is_successful=is_200) == 500
+    assert circuit_breaker.state == {"scope": aio_request.CircuitState.OPEN}
+
+    wall_clock = time.time()
+    monkeypatch.setattr(time, "time", lambda: wall_clock + 3600)
+
+    assert await circuit_breaker.execute(scope="scope", operation=do(200), fallback=503, is_successful=is_200) == 503
+    assert circuit_breaker.state == {"scope": aio_request.CircuitState.OPEN}
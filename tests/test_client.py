@@ -0,0 +1,88 @@
+import asyncio
+
+import multidict
+import prometheus_client as prom
+import pytest
+import yarl
+
+import aio_request
+
+
+@pytest.mark.parametrize(
+    "priority, context_priority, expected_priority",
+    [
+        (aio_request.Priority.LOW, None, aio_request.Priority.LOW),
+        (aio_request.Priority.LOW, aio_request.Priority.LOW, aio_request.Priority.LOW),
+        (aio_request.Priority.LOW, aio_request.Priority.NORMAL, aio_request.Priority.LOW),
+        (aio_request.Priority.LOW, aio_request.Priority.HIGH, aio_request.Priority.NORMAL),
+        (aio_request.Priority.NORMAL, aio_request.Priority.LOW, aio_request.Priority.NORMAL),
+        (aio_request.Priority.NORMAL, aio_request.Priority.HIGH, aio_request.Priority.NORMAL),
+        (aio_request.Priority.HIGH, aio_request.Priority.LOW, aio_request.Priority.NORMAL),
+        (aio_request.Priority.HIGH, aio_request.Priority.NORMAL, aio_request.Priority.HIGH),
+        (aio_request.Priority.HIGH, aio_request.Priority.HIGH, aio_request.Priority.HIGH),
+    ],
+)
+async def test_priority_normalization(
+    priority: aio_request.Priority,
+    context_priority: aio_request.Priority | None,
+    expected_priority: aio_request.Priority,
+) -> None:
+    priorities = []
+
+    async def send_request(
+        endpoint: yarl.URL, request: aio_request.Request, deadline: aio_request.Deadline, priority: aio_request.Priority
+    ) -> aio_request.ClosableResponse:
+        priorities.append(priority)
+        return aio_request.EmptyResponse(status=200)
+
+    client = aio_request.Client(
+        endpoint_provider=aio_request.StaticEndpointProvider("http://test.com"),
+        response_classifier=aio_request.DefaultResponseClassifier(),
+        request_strategy=aio_request.single_attempt_strategy(),
+        timeout=20,
+        priority=aio_request.Priority.NORMAL,
+        send_request=send_request,
+    )
+
+    with aio_request.set_context(priority=context_priority):
+        async with client.request(aio_request.get("/"), priority=priority) as response:
+            assert response.status == 200
+
+    assert priorities == [expected_priority]
+
+
+async def test_cancellation_while_response_is_in_use():
+    labels = {
+        "request_endpoint": "http://test.com/",
+        "request_method": "GET",
+        "request_path": "cancelled",
+        "circuit_breaker": "False",
+    }
+    closed = []
+
+    class Response(aio_request.EmptyResponse):
+        async def close(self) -> None:
+            closed.append(True)
+
+    async def send_request(
+        endpoint: yarl.URL, request: aio_request.Request, deadline: aio_request.Deadline, priority: aio_request.Priority
+    ) -> aio_request.ClosableResponse:
+        return Response(status=200, headers=multidict.CIMultiDictProxy[str](multidict.CIMultiDict[str]()))
+
+    client = aio_request.Client(
+        endpoint_provider=aio_request.StaticEndpointProvider("http://test.com"),
+        response_classifier=aio_request.DefaultResponseClassifier(),
+        request_strategy=aio_request.single_attempt_strategy(),
+        timeout=20,
+        priority=aio_request.Priority.NORMAL,
+        send_request=send_request,
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        async with client.request(aio_request.get("cancelled")) as response:
+            assert response.status == 200
+            raise asyncio.CancelledError
+
+    assert closed == [True]
+    assert prom.REGISTRY.get_sample_value("aio_request_latency_count", {**labels, "response_status": "200"}) == 1
+    assert prom.REGISTRY.get_sample_value("aio_request_latency_count", {**labels, "response_status": "499"}) == 1
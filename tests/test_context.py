@@ -0,0 +1,34 @@
+import aio_request
+
+
+async def test_set_context() -> None:
+    deadline = aio_request.Deadline.from_timeout(1)
+
+    with aio_request.set_context(deadline=deadline, priority=aio_request.Priority.HIGH):
+        context = aio_request.get_context()
+        assert context.deadline is deadline
+        assert context.priority == aio_request.Priority.HIGH
+
+        with aio_request.set_context(priority=aio_request.Priority.LOW):
+            assert aio_request.get_context().deadline is deadline
+            assert aio_request.get_context().priority == aio_request.Priority.LOW
+
+        assert aio_request.get_context() is context
+
+    assert aio_request.get_context().deadline is None
+    assert aio_request.get_context().priority is None
+
+
+async def test_set_same_context() -> None:
+    deadline = aio_request.Deadline.from_timeout(1)
+
+    with aio_request.set_context(deadline=deadline, priority=aio_request.Priority.HIGH):
+        context = aio_request.get_context()
+
+        with aio_request.set_context():
+            assert aio_request.get_context() is context
+
+        with aio_request.set_context(deadline=deadline, priority=aio_request.Priority.HIGH):
+            assert aio_request.get_context() is context
+
+        assert aio_request.get_context() is context
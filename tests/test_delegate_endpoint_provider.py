@@ -9,6 +9,7 @@ import aio_request
 async def test_delegate_endpoint():
     provider = aio_request.DelegateEndpointProvider(lambda: "http://example.com")
     assert await provider.get() == yarl.URL("http://example.com")
+    assert provider.get_nowait() is None
 
 
 async def test_delegate_endpoint_async():
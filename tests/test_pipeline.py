@@ -105,3 +105,18 @@ async def test_build_pipeline_earliest_module_should_pass():
         aio_request.Priority.HIGH,
     )
     assert response.status == 200
+
+
+@pytest.mark.parametrize("timeout, expected_status", [(5, 200), (0.001, 408), (0, 408)])
+async def test_build_pipeline_low_timeout_module(timeout: float, expected_status: int):
+    pipeline = aio_request.build_pipeline(
+        [aio_request.BypassModule(), aio_request.LowTimeoutModule(low_timeout_threshold=0.005), ResponseModule()]
+    )
+
+    response = await pipeline(
+        yarl.URL("http://www.google.ru"),
+        aio_request.get("search"),
+        aio_request.Deadline.from_timeout(timeout),
+        aio_request.Priority.HIGH,
+    )
+    assert response.status == expected_status
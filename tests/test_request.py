@@ -1,6 +1,11 @@
+import http
+
+import multidict
 import pytest
 import yarl
 
+import aio_request
+
 
 @pytest.mark.parametrize(
     "base, relative, actual",
@@ -27,3 +32,11 @@ async def test_absolute(base: str, relative: str, actual) -> None:
     expected = yarl.URL(base).join(yarl.URL(relative))
     assert expected == yarl.URL(actual)
     assert expected.raw_path.startswith("/")
+
+
+@pytest.mark.parametrize("method", [http.HTTPMethod.GET, multidict.istr("GET"), "".join(("G", "E", "T"))])
+async def test_method_of_str_subclass(method: str) -> None:
+    request = aio_request.request(method, "hello")
+
+    assert request.method == aio_request.Method.GET
+    assert request.update_headers({"a": "b"}).method == aio_request.Method.GET
@@ -1,3 +1,5 @@
+import pytest
+
 import aio_request
 
 from .conftest import FakeTransport
@@ -19,3 +21,12 @@ async def test_setup_v2_with_defaults():
     )
     async with client.request(aio_request.get("/")) as response:
         assert response.status == 200
+
+
+async def test_setup_with_negative_timeout():
+    with pytest.raises(ValueError):
+        aio_request.setup(
+            transport=FakeTransport(200),
+            endpoint="http://test.com",
+            timeout=-1,
+        )
@@ -0,0 +1,9 @@
+import yarl
+
+import aio_request
+
+
+async def test_static_endpoint():
+    provider = aio_request.StaticEndpointProvider("http://example.com")
+    assert await provider.get() == yarl.URL("http://example.com")
+    assert provider.get_nowait() == yarl.URL("http://example.com")
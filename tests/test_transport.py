@@ -73,6 +73,42 @@ async def test_json(httpbin, transport):
         await response.close()
 
 
+async def test_content_type(httpbin, transport):
+    response = await transport.send(
+        yarl.URL(httpbin.url),
+        aio_request.get("json"),
+        DEFAULT_TIMEOUT,
+    )
+    try:
+        assert response.content_type == "application/json"
+        assert response.is_json
+        assert response.headers is response.headers
+    finally:
+        await response.close()
+
+
+async def test_circuit_breaker(httpbin, transport):
+    response = await transport.send(
+        yarl.URL(httpbin.url),
+        aio_request.get("response-headers", query_parameters={"X-Circuit-Breaker": "1"}),
+        DEFAULT_TIMEOUT,
+    )
+    try:
+        assert response.circuit_breaker
+    finally:
+        await response.close()
+
+    response = await transport.send(
+        yarl.URL(httpbin.url),
+        aio_request.get("response-headers", query_parameters={"X-Request-Id": "1"}),
+        DEFAULT_TIMEOUT,
+    )
+    try:
+        assert not response.circuit_breaker
+    finally:
+        await response.close()
+
+
 async def test_utf8_text(httpbin, transport):
     response = await transport.send(
         yarl.URL(httpbin.url),